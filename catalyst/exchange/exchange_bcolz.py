@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 from catalyst import get_calendar
@@ -38,6 +40,24 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
     def data_frequency(self):
         return self._data_frequency
 
+    def has_sid(self, sid, field='close'):
+        """
+        Whether data was written for the sid in this bundle.
+
+        Parameters
+        ----------
+        sid: int
+        field: str
+
+        Returns
+        -------
+        bool
+
+        """
+        sid = int(sid)
+        return sid in self._carrays[field] or \
+            os.path.isdir(self._get_carray_path(sid, field))
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -72,7 +92,9 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
         if len(all_fields) == 1 and all_fields[0] == 'volume':
             all_fields.insert(0, 'close')
 
-        mask = None
+        # The mask of each sid is based on the first field, it must not
+        # leak to the other sids which may have different trading bounds.
+        masks = dict()
         data = []
         for field in all_fields:
             if field != 'volume':
@@ -84,8 +106,9 @@ class BcolzExchangeBarReader(BcolzMinuteBarReader):
                 carray = self._open_minute_file(field, sid)
                 a = carray[start_idx:end_idx + 1]
 
+                mask = masks.get(sid)
                 if mask is None:
-                    mask = a != 0
+                    mask = masks[sid] = a != 0
 
                 inverse_ratio = self._ohlc_ratio_inverse_for_sid(sid)
                 out[:len(mask), i][mask] = (
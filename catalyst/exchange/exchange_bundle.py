@@ -1,8 +1,10 @@
 import os
 import shutil
+from collections import deque
 from datetime import timedelta
 from functools import partial
 from itertools import chain
+from multiprocessing.pool import ThreadPool
 from operator import is_not
 
 import numpy as np
@@ -20,27 +22,51 @@ from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
     TempBundleNotFoundError, \
     NoDataAvailableOnExchange, \
     PricingDataNotLoadedError, DataCorruptionError, PricingDataValueError
-from catalyst.exchange.utils.bundle_utils import range_in_bundle, \
-    get_bcolz_chunk, get_df_from_arrays, get_assets
+from catalyst.exchange.utils.bundle_utils import ranges_in_bundle, \
+    get_values_in_bundle, get_bcolz_chunk, get_assets
 from catalyst.exchange.utils.datetime_utils import get_start_dt, \
-    get_period_label, get_month_start_end, get_year_start_end
+    get_periods_start_end, get_month_start_end, get_year_start_end
 from catalyst.exchange.utils.exchange_utils import get_exchange_folder, \
     save_exchange_symbols, mixin_market_params, get_catalyst_symbol
 from catalyst.utils.cli import maybe_show_progress
+from catalyst.utils.memoize import weak_lru_cache
 from catalyst.utils.paths import ensure_directory
 from logbook import Logger
-from pytz import UTC
-from six import itervalues
+from six import itervalues, iteritems
 
 log = Logger('exchange_bundle', level=LOG_LEVEL)
 
 BUNDLE_NAME_TEMPLATE = os.path.join('{root}', '{frequency}_bundle')
 
+# The number of ctable chunks downloaded concurrently
+INGEST_THREADS = 8
+
+# The number of ctable chunks fetched ahead of the writer
+INGEST_QUEUE_SIZE = 2 * INGEST_THREADS
+
 
 def _cachpath(symbol, type_):
     return '-'.join([symbol, type_])
 
 
+def _log_rmtree_error(function, path, excinfo):
+    log.warn('unable to remove temp bundle: {}'.format(excinfo[1]))
+
+
+def _dir_nonempty(path):
+    # Reading a single entry instead of listing the whole directory,
+    # os.scandir is not available before Python 3.5
+    if not hasattr(os, 'scandir'):
+        return len(os.listdir(path)) > 0
+
+    entries = os.scandir(path)
+    try:
+        return next(entries, None) is not None
+    finally:
+        if hasattr(entries, 'close'):
+            entries.close()
+
+
 class ExchangeBundle:
     def __init__(self, exchange_name):
         self.exchange_name = exchange_name
@@ -48,9 +74,35 @@ class ExchangeBundle:
         self.default_ohlc_ratio = 1000000
         self._writers = dict()
         self._readers = dict()
+        self._bundle_paths = dict()
+        self._cleanup_pool = None
         self.calendar = get_calendar('OPEN')
         self.exchange = None
 
+    def _bundle_path(self, data_frequency):
+        """
+        The path of the main bundle of the exchange for the given data
+        frequency. The path is stable so it is only built once.
+
+        Parameters
+        ----------
+        data_frequency: str
+
+        Returns
+        -------
+        str
+
+        """
+        path = self._bundle_paths.get(data_frequency)
+        if path is None:
+            path = self._bundle_paths[data_frequency] = \
+                BUNDLE_NAME_TEMPLATE.format(
+                    root=get_exchange_folder(self.exchange_name),
+                    frequency=data_frequency
+                )
+
+        return path
+
     def get_reader(self, data_frequency, path=None):
         """
         Get a data writer object, either a new object or from cache
@@ -61,24 +113,22 @@ class ExchangeBundle:
 
         """
         if path is None:
-            root = get_exchange_folder(self.exchange_name)
-            path = BUNDLE_NAME_TEMPLATE.format(
-                root=root,
-                frequency=data_frequency
-            )
+            path = self._bundle_path(data_frequency)
 
-        if path in self._readers and self._readers[path] is not None:
-            return self._readers[path]
+        reader = self._readers.get(path)
+        if reader is not None:
+            return reader
 
         try:
-            self._readers[path] = BcolzExchangeBarReader(
+            reader = BcolzExchangeBarReader(
                 rootdir=path,
                 data_frequency=data_frequency
             )
         except IOError:
-            self._readers[path] = None
+            reader = None
 
-        return self._readers[path]
+        self._readers[path] = reader
+        return reader
 
     def update_metadata(self, writer, start_dt, end_dt):
         pass
@@ -92,18 +142,15 @@ class ExchangeBundle:
         BcolzMinuteBarWriter | BcolzDailyBarWriter
 
         """
-        root = get_exchange_folder(self.exchange_name)
-        path = BUNDLE_NAME_TEMPLATE.format(
-            root=root,
-            frequency=data_frequency
-        )
+        path = self._bundle_path(data_frequency)
 
-        if path in self._writers:
-            return self._writers[path]
+        writer = self._writers.get(path)
+        if writer is not None:
+            return writer
 
         ensure_directory(path)
 
-        if len(os.listdir(path)) > 0:
+        if _dir_nonempty(path):
 
             metadata = BcolzMinuteBarMetadata.read(path)
 
@@ -121,16 +168,15 @@ class ExchangeBundle:
             else:
                 end_session = metadata.end_session
 
-            self._writers[path] = \
-                BcolzExchangeBarWriter(
-                    rootdir=path,
-                    start_session=start_session,
-                    end_session=end_session,
-                    write_metadata=write_metadata,
-                    data_frequency=data_frequency
-                )
+            writer = BcolzExchangeBarWriter(
+                rootdir=path,
+                start_session=start_session,
+                end_session=end_session,
+                write_metadata=write_metadata,
+                data_frequency=data_frequency
+            )
         else:
-            self._writers[path] = BcolzExchangeBarWriter(
+            writer = BcolzExchangeBarWriter(
                 rootdir=path,
                 start_session=start_dt,
                 end_session=end_dt,
@@ -138,7 +184,8 @@ class ExchangeBundle:
                 data_frequency=data_frequency
             )
 
-        return self._writers[path]
+        self._writers[path] = writer
+        return writer
 
     def filter_existing_assets(self, assets, start_dt, end_dt, data_frequency):
         """
@@ -162,38 +209,37 @@ class ExchangeBundle:
             The assets missing from the bundle
         """
         reader = self.get_reader(data_frequency)
-        missing_assets = []
-        for asset in assets:
-            has_data = range_in_bundle(asset, start_dt, end_dt, reader)
+        has_data = ranges_in_bundle(assets, start_dt, end_dt, reader)
 
-            if not has_data:
-                missing_assets.append(asset)
-
-        return missing_assets
+        return [asset for asset, exists in zip(assets, has_data)
+                if not exists]
 
     def _write(self, data, writer, data_frequency):
-        try:
-            writer.write(
-                data=data,
-                show_progress=False,
-                invalid_data_behavior='raise'
-            )
-        except BcolzMinuteOverlappingData as e:
-            log.debug('chunk already exists: {}'.format(e))
-        except Exception as e:
-            log.warn('error when writing data: {}, trying again'.format(e))
-
-            # This is workaround, there is an issue with empty
-            # session_label when using a newly created writer
-            del self._writers[writer._rootdir]
-
-            writer = self.get_writer(writer._start_session,
-                                     writer._end_session, data_frequency)
-            writer.write(
-                data=data,
-                show_progress=False,
-                invalid_data_behavior='raise'
-            )
+        for sid, dts, cols in data:
+            try:
+                writer.write_cols(
+                    sid=sid,
+                    dts=dts,
+                    cols=cols,
+                    invalid_data_behavior='raise'
+                )
+            except BcolzMinuteOverlappingData as e:
+                log.debug('chunk already exists: {}'.format(e))
+            except Exception as e:
+                log.warn('error when writing data: {}, trying again'.format(e))
+
+                # This is workaround, there is an issue with empty
+                # session_label when using a newly created writer
+                del self._writers[writer._rootdir]
+
+                writer = self.get_writer(writer._start_session,
+                                         writer._end_session, data_frequency)
+                writer.write_cols(
+                    sid=sid,
+                    dts=dts,
+                    cols=cols,
+                    invalid_data_behavior='raise'
+                )
 
     def get_calendar_periods_range(self, start_dt, end_dt, data_frequency):
         """
@@ -210,21 +256,72 @@ class ExchangeBundle:
         list[datetime]
 
         """
+        # Caching by epoch value avoids comparing tz-naive and tz-aware
+        # timestamps when looking up the cache.
+        return self._get_calendar_periods_range(
+            start_dt.value, end_dt.value, data_frequency
+        )
+
+    @weak_lru_cache(32)
+    def _get_calendar_periods_range(self, start, end, data_frequency):
+        start_dt = pd.Timestamp(start, tz='UTC')
+        end_dt = pd.Timestamp(end, tz='UTC')
+
         return self.calendar.minutes_in_range(start_dt, end_dt) \
             if data_frequency == 'minute' \
             else self.calendar.sessions_in_range(start_dt, end_dt)
 
-    def _spot_empty_periods(self, ohlcv_df, asset, data_frequency,
-                            empty_rows_behavior):
+    def _spot_empty_periods(self, row_dates, empty_rows, asset,
+                            data_frequency, empty_rows_behavior):
+        """
+        Report the empty rows of a chunk of OHLCV data.
+
+        Parameters
+        ----------
+        row_dates: np.ndarray[datetime64]
+            The UTC dates of the rows.
+        empty_rows: np.ndarray[bool]
+            Whether each row has missing values.
+        asset: TradingPair
+        data_frequency: str
+        empty_rows_behavior: str
+
+        Returns
+        -------
+        list[str], bool
+            The problems found and whether the empty rows should be
+            stripped.
+
+        """
         problems = []
+        strip = False
+
+        if empty_rows.any():
+            # Only the empty rows after the first trading date are relevant
+            empty_rows = empty_rows & (
+                row_dates > np.datetime64(asset.start_date.value, 'ns')
+            )
+            indices = np.flatnonzero(empty_rows)
 
-        nan_rows = ohlcv_df[ohlcv_df.isnull().T.any().T].index
-        if len(nan_rows) > 0:
+            # Grouping the empty rows one period apart into date ranges,
+            # rows missing from the index break a range
             dates = []
-            for row_date in nan_rows.values:
-                row_date = pd.to_datetime(row_date, utc=True)
-                if row_date > asset.start_date:
-                    dates.append(row_date)
+            if len(indices) > 0:
+                step = np.timedelta64(1, 'm') if data_frequency == 'minute' \
+                    else np.timedelta64(1, 'D')
+                gaps = np.diff(row_dates[indices]) > step
+                starts = pd.to_datetime(
+                    row_dates[indices[np.r_[True, gaps]]], utc=True
+                )
+                ends = pd.to_datetime(
+                    row_dates[indices[np.r_[gaps, True]]], utc=True
+                )
+                dates = [
+                    '{} - {}'.format(
+                        start.strftime(DATE_TIME_FORMAT),
+                        end.strftime(DATE_TIME_FORMAT)
+                    ) for start, end in zip(starts, ends)
+                ]
 
             if len(dates) > 0:
                 end_dt = asset.end_minute if data_frequency == 'minute' \
@@ -236,8 +333,7 @@ class ExchangeBundle:
                                 start_dt=asset.start_date.strftime(
                                     DATE_TIME_FORMAT),
                                 end_dt=end_dt.strftime(DATE_TIME_FORMAT),
-                                dates=[date.strftime(
-                                    DATE_TIME_FORMAT) for date in dates])
+                                dates=dates)
 
                 if empty_rows_behavior == 'warn':
                     log.warn(problem)
@@ -249,14 +345,14 @@ class ExchangeBundle:
                         dates=dates, )
 
                 else:
-                    ohlcv_df.dropna(inplace=True)
+                    strip = True
 
             else:
                 problem = None
 
             problems.append(problem)
 
-        return problems
+        return problems, strip
 
     def _spot_duplicates(self, ohlcv_df, asset, data_frequency, threshold):
         # TODO: work in progress
@@ -297,66 +393,136 @@ class ExchangeBundle:
 
         return problems
 
-    def ingest_df(self, ohlcv_df, data_frequency, asset, writer,
-                  empty_rows_behavior='warn', duplicates_threshold=None):
+    def _prepare_cols(self, asset, dts, cols, data_frequency,
+                      empty_rows_behavior='warn'):
         """
-        Ingest a DataFrame of OHLCV data for a given market.
+        Validate the OHLCV columns of a given market and prepare them for
+        the writer.
 
         Parameters
         ----------
-        ohlcv_df: DataFrame
-        data_frequency: str
         asset: TradingPair
-        writer:
+        dts: np.ndarray[datetime64]
+            The sorted UTC dates of the rows.
+        cols: dict[str, np.ndarray]
+        data_frequency: str
         empty_rows_behavior: str
 
+        Returns
+        -------
+        list[tuple(int, np.ndarray, dict[str, np.ndarray])], list[str]
+            The data to write and the problems found in the columns.
+
         """
         problems = []
-        if empty_rows_behavior is not 'ignore':
-            problems += self._spot_empty_periods(
-                ohlcv_df, asset, data_frequency, empty_rows_behavior
+        if empty_rows_behavior != 'ignore':
+            empty_rows = np.zeros(len(dts), dtype=bool)
+            for values in itervalues(cols):
+                empty_rows |= pd.isnull(values)
+
+            spotted, strip = self._spot_empty_periods(
+                dts, empty_rows, asset, data_frequency, empty_rows_behavior
             )
+            problems += spotted
+
+            if strip:
+                dts = dts[~empty_rows]
+                cols = dict(
+                    (field, values[~empty_rows])
+                    for field, values in iteritems(cols)
+                )
+
+        data = []
+        if len(dts) > 0:
+            data.append((asset.sid, dts, cols))
 
+        return data, problems
+
+    def _prepare_df(self, ohlcv_df, data_frequency, asset,
+                    empty_rows_behavior='warn', duplicates_threshold=None):
+        """
+        Validate a DataFrame of OHLCV data for a given market and prepare
+        it for the writer.
+
+        Parameters
+        ----------
+        ohlcv_df: DataFrame
+        data_frequency: str
+        asset: TradingPair
+        empty_rows_behavior: str
+
+        Returns
+        -------
+        list[tuple(int, np.ndarray, dict[str, np.ndarray])], list[str]
+            The data to write and the problems found in the DataFrame.
+
+        """
         # if duplicates_threshold is not None:
         #     problems += self._spot_duplicates(
         #         ohlcv_df, asset, data_frequency, duplicates_threshold
         #     )
 
-        data = []
-        if not ohlcv_df.empty:
-            ohlcv_df.sort_index(inplace=True)
-            data.append((asset.sid, ohlcv_df))
+        ohlcv_df = ohlcv_df.sort_index()
+        cols = dict(
+            (field, ohlcv_df[field].values)
+            for field in ['open', 'high', 'low', 'close', 'volume']
+        )
+        return self._prepare_cols(
+            asset=asset,
+            dts=ohlcv_df.index.values,
+            cols=cols,
+            data_frequency=data_frequency,
+            empty_rows_behavior=empty_rows_behavior
+        )
+
+    def ingest_df(self, ohlcv_df, data_frequency, asset, writer,
+                  empty_rows_behavior='warn', duplicates_threshold=None):
+        """
+        Ingest a DataFrame of OHLCV data for a given market.
+
+        Parameters
+        ----------
+        ohlcv_df: DataFrame
+        data_frequency: str
+        asset: TradingPair
+        writer:
+        empty_rows_behavior: str
 
+        """
+        data, problems = self._prepare_df(
+            ohlcv_df=ohlcv_df,
+            data_frequency=data_frequency,
+            asset=asset,
+            empty_rows_behavior=empty_rows_behavior,
+            duplicates_threshold=duplicates_threshold
+        )
         self._write(data, writer, data_frequency)
 
         return problems
 
-    def ingest_ctable(self, asset, data_frequency, period,
-                      writer, empty_rows_behavior='strip',
-                      duplicates_threshold=100, cleanup=False):
+    def _fetch_ctable(self, asset, data_frequency, period,
+                      empty_rows_behavior='strip', cleanup=False):
         """
-        Merge a ctable bundle chunk into the main bundle for the exchange.
+        Download a ctable bundle chunk and prepare its data for the main
+        bundle of the exchange.
 
         Parameters
         ----------
         asset: TradingPair
         data_frequency: str
         period: str
-        writer:
         empty_rows_behavior: str
             Ensure that the bundle does not have any missing data.
 
         cleanup: bool
-            Remove the temp bundle directory after ingestion.
+            Remove the temp bundle directory after loading its data.
 
         Returns
         -------
-        list[str]
-            A list of problems which occurred during ingestion.
+        list[tuple(int, np.ndarray, dict[str, np.ndarray])], list[str]
+            The data to write and the problems which occurred.
 
         """
-        problems = []
-
         # Download and extract the bundle
         path = get_bcolz_chunk(
             exchange_name=self.exchange_name,
@@ -383,11 +549,12 @@ class ExchangeBundle:
         if data_frequency == 'daily':
             end_dt = end_dt - pd.Timedelta(hours=23, minutes=59)
 
+        fields = ['open', 'high', 'low', 'close', 'volume']
         arrays = None
         try:
             arrays = reader.load_raw_arrays(
                 sids=[asset.sid],
-                fields=['open', 'high', 'low', 'close', 'volume'],
+                fields=fields,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
@@ -397,19 +564,23 @@ class ExchangeBundle:
             ))
 
         if not arrays:
-            return reader._rootdir
+            return [], []
 
         periods = self.get_calendar_periods_range(
             start_dt, end_dt, data_frequency
         )
-        df = get_df_from_arrays(arrays, periods)
-        problems += self.ingest_df(
-            ohlcv_df=df,
-            data_frequency=data_frequency,
+        # The columns are passed to the writer as they are, the calendar
+        # periods are already sorted
+        cols = dict(
+            (field, arrays[index].ravel())
+            for index, field in enumerate(fields)
+        )
+        data, problems = self._prepare_cols(
             asset=asset,
-            writer=writer,
-            empty_rows_behavior=empty_rows_behavior,
-            duplicates_threshold=duplicates_threshold
+            dts=periods.values,
+            cols=cols,
+            data_frequency=data_frequency,
+            empty_rows_behavior=empty_rows_behavior
         )
 
         if cleanup:
@@ -417,9 +588,53 @@ class ExchangeBundle:
                 'removing bundle folder following ingestion: {}'.format(
                     reader._rootdir)
             )
-            shutil.rmtree(reader._rootdir)
+            if self._cleanup_pool is not None:
+                # Removing the folder in the background to avoid delaying
+                # the next download
+                self._cleanup_pool.apply_async(
+                    shutil.rmtree, (reader._rootdir,),
+                    dict(onerror=_log_rmtree_error)
+                )
+            else:
+                shutil.rmtree(reader._rootdir)
 
-        return filter(partial(is_not, None), problems)
+        return data, list(filter(partial(is_not, None), problems))
+
+    def ingest_ctable(self, asset, data_frequency, period,
+                      writer, empty_rows_behavior='strip',
+                      duplicates_threshold=100, cleanup=False):
+        """
+        Merge a ctable bundle chunk into the main bundle for the exchange.
+
+        Parameters
+        ----------
+        asset: TradingPair
+        data_frequency: str
+        period: str
+        writer:
+        empty_rows_behavior: str
+            Ensure that the bundle does not have any missing data.
+
+        cleanup: bool
+            Remove the temp bundle directory after ingestion.
+
+        Returns
+        -------
+        list[str]
+            A list of problems which occurred during ingestion.
+
+        """
+        # The duplicates check is disabled, duplicates_threshold is ignored
+        data, problems = self._fetch_ctable(
+            asset=asset,
+            data_frequency=data_frequency,
+            period=period,
+            empty_rows_behavior=empty_rows_behavior,
+            cleanup=cleanup
+        )
+        self._write(data, writer, data_frequency)
+
+        return problems
 
     def get_adj_dates(self, start, end, assets, data_frequency):
         """
@@ -439,23 +654,41 @@ class ExchangeBundle:
         """
         earliest_trade = None
         last_entry = None
-        for asset in assets:
-            if earliest_trade is None or earliest_trade > asset.start_date:
-                if asset.start_date >= self.calendar.first_session:
-                    earliest_trade = asset.start_date
-
-                else:
-                    earliest_trade = self.calendar.first_session
-
-            end_asset = asset.end_minute if data_frequency == 'minute' else \
-                asset.end_daily
-            if end_asset is not None:
-                if last_entry is None or end_asset > last_entry:
-                    last_entry = end_asset
+        if assets:
+            # Reducing the epoch values of the dates instead of comparing
+            # the timestamps one by one
+            starts = np.fromiter(
+                (asset.start_date.value for asset in assets),
+                dtype=np.int64,
+                count=len(assets)
+            )
+            earliest_trade = pd.Timestamp(
+                max(starts.min(), self.calendar.first_session.value),
+                tz='UTC'
+            )
 
-            else:
+            end_assets = [
+                asset.end_minute if data_frequency == 'minute'
+                else asset.end_daily for asset in assets
+            ]
+
+            # An asset without an end date resets the end of the range,
+            # only the assets following it are considered.
+            missing_ends = [
+                index for index, end_asset in enumerate(end_assets)
+                if end_asset is None
+            ]
+            if missing_ends:
                 end = None
-                last_entry = None
+                end_assets = end_assets[missing_ends[-1] + 1:]
+
+            if end_assets:
+                ends = np.fromiter(
+                    (end_asset.value for end_asset in end_assets),
+                    dtype=np.int64,
+                    count=len(end_assets)
+                )
+                last_entry = pd.Timestamp(ends.max(), tz='UTC')
 
         if start is None or \
                 (earliest_trade is not None and earliest_trade > start):
@@ -491,13 +724,11 @@ class ExchangeBundle:
         dict[TradingPair, list[dict(str, Object]]]
 
         """
-        get_start_end = get_month_start_end \
-            if data_frequency == 'minute' else get_year_start_end
-
         # Get a reader for the main bundle to verify if data exists
         reader = self.get_reader(data_frequency)
 
         chunks = dict()
+        candidates = dict()
         for asset in assets:
             try:
                 # Checking if the the asset has price data in the specified
@@ -511,50 +742,41 @@ class ExchangeBundle:
                 log.debug('skipping {}: {}'.format(asset.symbol, e))
                 continue
 
-            dates = pd.date_range(
-                start=get_period_label(adj_start, data_frequency),
-                end=get_period_label(adj_end, data_frequency),
-                freq='MS' if data_frequency == 'minute' else 'AS',
-                tz=UTC
+            # The periods are bound by the asset's trading dates
+            periods, period_starts, period_ends = get_periods_start_end(
+                adj_start, adj_end, data_frequency
             )
 
-            # Adjusting the last date of the range to avoid
-            # going over the asset's trading bounds
-            dates.values[0] = adj_start
-            dates.values[-1] = adj_end
+            # Currencies don't always start trading at midnight.
+            # Checking the last minute of the day instead.
+            range_starts = period_starts.normalize() \
+                + pd.Timedelta(hours=23, minutes=59) \
+                if data_frequency == 'minute' else period_starts
 
             chunks[asset] = []
-            for index, dt in enumerate(dates):
-                period_start, period_end = get_start_end(
-                    dt=dt,
-                    first_day=dt if index == 0 else None,
-                    last_day=dt if index == len(dates) - 1 else None
-                )
-
-                # Currencies don't always start trading at midnight.
-                # Checking the last minute of the day instead.
-                range_start = period_start.replace(hour=23, minute=59) \
-                    if data_frequency == 'minute' else period_start
-
-                # Checking if the data already exists in the bundle
-                # for the date range of the chunk. If not, we create
-                # a chunk for ingestion.
-                has_data = range_in_bundle(
-                    asset, range_start, period_end, reader
-                )
-                if not has_data:
-                    period = get_period_label(dt, data_frequency)
+            for period, range_start, period_end in \
+                    zip(periods, range_starts, period_ends):
+                key = (range_start, period_end)
+                candidates.setdefault(key, []).append((asset, period))
+
+        # Checking if the data already exists in the bundle for the date
+        # range of each chunk. Assets sharing the same date range are
+        # probed at once. If not, we create a chunk for ingestion.
+        # Sorting the ranges keeps the chunks of each asset sorted by date.
+        for range_start, period_end in sorted(candidates):
+            asset_periods = candidates[(range_start, period_end)]
+            has_data = ranges_in_bundle(
+                [asset for asset, _ in asset_periods],
+                range_start, period_end, reader
+            )
+            for (asset, period), exists in zip(asset_periods, has_data):
+                if not exists:
                     chunk = dict(
                         asset=asset,
                         period=period,
                     )
                     chunks[asset].append(chunk)
 
-            # We sort the chunks by end date to ingest most recent data first
-            chunks[asset].sort(
-                key=lambda chunk: pd.to_datetime(chunk['period'])
-            )
-
         return chunks
 
     def ingest_assets(self, assets, data_frequency, start_dt=None, end_dt=None,
@@ -597,51 +819,85 @@ class ExchangeBundle:
         # This is the common writer for the entire exchange bundle
         # we want to give an end_date far in time
         writer = self.get_writer(start_dt, end_dt, data_frequency)
-        if show_breakdown:
-            if chunks:
-                for asset in chunks:
+
+        # Auto-ingestion gets here even when the bundle is up to date
+        if not any(itervalues(chunks)):
+            return
+
+        def fetch_chunk(chunk):
+            return self._fetch_ctable(
+                asset=chunk['asset'],
+                data_frequency=data_frequency,
+                period=chunk['period'],
+                empty_rows_behavior='strip',
+                cleanup=True
+            )
+
+        def fetch_chunks(chunk_list):
+            # Keeping a bounded number of fetches in flight so that the
+            # fetched data does not pile up when writing is slower
+            in_flight = deque()
+            for chunk in chunk_list:
+                in_flight.append(pool.apply_async(fetch_chunk, (chunk,)))
+
+                if len(in_flight) >= INGEST_QUEUE_SIZE:
+                    yield in_flight.popleft().get()
+
+            while in_flight:
+                yield in_flight.popleft().get()
+
+        def write_chunk(data, chunk_problems):
+            problems.extend(chunk_problems)
+            self._write(data, writer, data_frequency)
+
+        pool = ThreadPool(INGEST_THREADS)
+        self._cleanup_pool = ThreadPool(1)
+        try:
+            if show_breakdown:
+                if chunks:
+                    for asset in chunks:
+                        with maybe_show_progress(
+                            fetch_chunks(chunks[asset]),
+                            show_progress,
+                            length=len(chunks[asset]),
+                            label='Ingesting {frequency} price data for '
+                                  '{symbol} on {exchange}'.format(
+                                exchange=self.exchange_name,
+                                frequency=data_frequency,
+                                symbol=asset.symbol
+                                )) as it:
+                            for data, chunk_problems in it:
+                                write_chunk(data, chunk_problems)
+            else:
+                all_chunks = list(chain.from_iterable(itervalues(chunks)))
+                # We sort the chunks by end date to ingest most recent
+                # data first
+                if all_chunks:
+                    all_chunks.sort(
+                        key=lambda chunk: pd.to_datetime(chunk['period'])
+                    )
                     with maybe_show_progress(
-                        chunks[asset],
+                        fetch_chunks(all_chunks),
                         show_progress,
-                        label='Ingesting {frequency} price data for '
-                              '{symbol} on {exchange}'.format(
+                        length=len(all_chunks),
+                        label='Ingesting {frequency} price data on '
+                              '{exchange}'.format(
                             exchange=self.exchange_name,
                             frequency=data_frequency,
-                            symbol=asset.symbol
                             )) as it:
-                        for chunk in it:
-                            problems += self.ingest_ctable(
-                                asset=chunk['asset'],
-                                data_frequency=data_frequency,
-                                period=chunk['period'],
-                                writer=writer,
-                                empty_rows_behavior='strip',
-                                cleanup=True
-                            )
-        else:
-            all_chunks = list(chain.from_iterable(itervalues(chunks)))
-            # We sort the chunks by end date to ingest most recent data first
-            if all_chunks:
-                all_chunks.sort(
-                    key=lambda chunk: pd.to_datetime(chunk['period'])
-                )
-                with maybe_show_progress(
-                    all_chunks,
-                    show_progress,
-                    label='Ingesting {frequency} price data on '
-                          '{exchange}'.format(
-                        exchange=self.exchange_name,
-                        frequency=data_frequency,
-                        )) as it:
-                    for chunk in it:
-                        problems += self.ingest_ctable(
-                            asset=chunk['asset'],
-                            data_frequency=data_frequency,
-                            period=chunk['period'],
-                            writer=writer,
-                            empty_rows_behavior='strip',
-                            cleanup=True
-                        )
+                        for data, chunk_problems in it:
+                            write_chunk(data, chunk_problems)
+
+        finally:
+            # No fetch is submitted past this point, waiting for the ones
+            # in flight since they may still schedule a cleanup
+            pool.close()
+            pool.join()
+
+            # Waiting for the temp bundles to be removed
+            self._cleanup_pool.close()
+            self._cleanup_pool.join()
+            self._cleanup_pool = None
 
         if show_report and len(problems) > 0:
             log.info('problems during ingestion:{}\n'.format(
@@ -848,19 +1104,18 @@ class ExchangeBundle:
 
         Returns
         -------
-        Series
+        DataFrame
 
         """
         if AUTO_INGEST or force_auto_ingest:
             try:
-                series = self.get_history_window_series(
+                return self.get_history_window_series(
                     assets=assets,
                     end_dt=end_dt,
                     bar_count=bar_count,
                     field=field,
                     data_frequency=data_frequency,
                 )
-                return pd.DataFrame(series)
 
             except PricingDataNotLoadedError:
                 start_dt = get_start_dt(end_dt, bar_count, data_frequency)
@@ -880,7 +1135,7 @@ class ExchangeBundle:
                     show_progress=True,
                     show_breakdown=True
                 )
-                series = self.get_history_window_series(
+                return self.get_history_window_series(
                     assets=assets,
                     end_dt=end_dt,
                     bar_count=bar_count,
@@ -888,17 +1143,15 @@ class ExchangeBundle:
                     data_frequency=data_frequency,
                     reset_reader=True,
                 )
-                return series
 
         else:
-            series = self.get_history_window_series(
+            return self.get_history_window_series(
                 assets=assets,
                 end_dt=end_dt,
                 bar_count=bar_count,
                 field=field,
                 data_frequency=data_frequency,
             )
-            return pd.DataFrame(series)
 
     def get_spot_values(self,
                         assets,
@@ -931,13 +1184,20 @@ class ExchangeBundle:
                 del self._readers[reader._rootdir]
                 reader = self.get_reader(data_frequency)
 
-            for asset in assets:
-                value = reader.get_value(
-                    sid=asset.sid,
-                    dt=dt,
-                    field=field
+            try:
+                # Reading the values of all assets at once
+                values = list(
+                    get_values_in_bundle(assets, field, dt, reader)
                 )
-                values.append(value)
+
+            except Exception:
+                for asset in assets:
+                    value = reader.get_value(
+                        sid=asset.sid,
+                        dt=dt,
+                        field=field
+                    )
+                    values.append(value)
 
             return values
 
@@ -987,14 +1247,8 @@ class ExchangeBundle:
                 end_dt=end_dt
             )
 
-        series = dict()
-        for asset in assets:
-            asset_start_dt, _ = self.get_adj_dates(
-                start_dt, end_dt, assets, data_frequency
-            )
-            in_bundle = range_in_bundle(
-                asset, asset_start_dt, end_dt, reader
-            )
+        has_data = ranges_in_bundle(assets, start_dt, end_dt, reader)
+        for asset, in_bundle in zip(assets, has_data):
             if not in_bundle:
                 raise PricingDataNotLoadedError(
                     field=field,
@@ -1003,47 +1257,43 @@ class ExchangeBundle:
                     symbols=asset.symbol,
                     symbol_list=asset.symbol,
                     data_frequency=data_frequency,
-                    start_dt=asset_start_dt,
+                    start_dt=start_dt,
                     end_dt=end_dt
                 )
 
-            periods = self.get_calendar_periods_range(
-                asset_start_dt, end_dt, data_frequency
-            )
-            # This does not behave well when requesting multiple assets
-            # when the start or end date of one asset is outside of the range
-            # looking at the logic in load_raw_arrays(), we are not achieving
-            # any performance gain by requesting multiple sids at once. It's
-            # looping through the sids and making separate requests anyway.
-            arrays = reader.load_raw_arrays(
-                sids=[asset.sid],
-                fields=[field],
+        periods = self.get_calendar_periods_range(
+            start_dt, end_dt, data_frequency
+        )
+
+        # The reader returns one column per sid, we build the DataFrame
+        # directly from it.
+        arrays = reader.load_raw_arrays(
+            sids=[asset.sid for asset in assets],
+            fields=[field],
+            start_dt=start_dt,
+            end_dt=end_dt
+        )
+        symbols = [asset.symbol for asset in assets]
+        if len(arrays) == 0:
+            raise DataCorruptionError(
+                exchange=self.exchange_name,
+                symbols=symbols,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            if len(arrays) == 0:
-                raise DataCorruptionError(
-                    exchange=self.exchange_name,
-                    symbols=asset.symbol,
-                    start_dt=asset_start_dt,
-                    end_dt=end_dt
-                )
-
-            field_values = arrays[0][:, 0]
 
-            try:
-                value_series = pd.Series(field_values, index=periods)
-                series[asset] = value_series
-            except ValueError as e:
-                raise PricingDataValueError(
-                    exchange=asset.exchange,
-                    symbol=asset.symbol,
-                    start_dt=asset_start_dt,
-                    end_dt=end_dt,
-                    error=e
-                )
+        try:
+            df = pd.DataFrame(arrays[0], index=periods, columns=assets)
+        except ValueError as e:
+            raise PricingDataValueError(
+                exchange=self.exchange_name,
+                symbol=symbols,
+                start_dt=start_dt,
+                end_dt=end_dt,
+                error=e
+            )
 
-        return series
+        return df
 
     def clean(self, data_frequency):
         """
@@ -1078,8 +1328,7 @@ class ExchangeBundle:
             else [data_frequency]
 
         for frequency in frequencies:
-            label = '{}_bundle'.format(frequency)
-            frequency_bundle = os.path.join(root, label)
+            frequency_bundle = self._bundle_path(frequency)
 
             if os.path.isdir(frequency_bundle):
                 log.debug(
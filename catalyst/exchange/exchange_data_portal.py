@@ -316,7 +316,7 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
         else:  # data_frequency == "daily":
             last_dt_for_series = end_dt
 
-        series = bundle.get_history_window_series_and_load(
+        bundle_df = bundle.get_history_window_series_and_load(
             assets=assets,
             end_dt=last_dt_for_series,
             bar_count=adj_bar_count,
@@ -327,7 +327,7 @@ class DataPortalExchangeBacktest(DataPortalExchangeBase):
 
         start_dt = get_start_dt(last_dt_for_series, adj_bar_count,
                                 adj_data_frequency, False)
-        df = resample_history_df(pd.DataFrame(series), freq, field, start_dt)
+        df = resample_history_df(bundle_df, freq, field, start_dt)
 
         return df
 
@@ -1,5 +1,7 @@
 import os
 import tarfile
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 import pandas as pd
@@ -10,6 +12,7 @@ from catalyst.exchange.utils.exchange_utils import get_exchange_bundles_folder
 
 EXCHANGE_NAMES = ['bitfinex', 'bittrex', 'poloniex', 'binance']
 API_URL = 'http://data.enigma.co/api/v1'
+PROBE_THREADS = 8
 
 
 def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
@@ -82,6 +85,9 @@ def range_in_bundle(asset, start_dt, end_dt, reader):
     Evaluate whether price data of an asset is included has been ingested in
     the exchange bundle for the given date range.
 
+    The values are read without the get_value cache of the reader so that
+    several assets can be probed concurrently.
+
     Parameters
     ----------
     asset: TradingPair
@@ -94,19 +100,111 @@ def range_in_bundle(asset, start_dt, end_dt, reader):
     bool
 
     """
-    has_data = True
-    dates = [start_dt, end_dt]
+    try:
+        for dt in (start_dt, end_dt):
+            closes = get_values_in_bundle([asset], 'close', dt, reader)
+            if np.isnan(closes[0]):
+                return False
+
+    except Exception:
+        return False
+
+    return True
+
+
+def get_values_in_bundle(assets, field, dt, reader):
+    """
+    The values of the assets for the given field and date, read from the
+    exchange bundle in a single columnar pass.
+
+    Parameters
+    ----------
+    assets: list[TradingPair]
+    field: str
+    dt: pd.Timestamp
+    reader: BcolzBarMinuteReader
+
+    Returns
+    -------
+    np.ndarray
+        One value per asset, NaN when no price data is available.
 
-    while dates and has_data:
-        try:
-            dt = dates.pop(0)
-            close = reader.get_value(asset.sid, dt, 'close')
+    """
+    if dt < reader.first_trading_day:
+        return np.full(len(assets), np.nan)
+
+    arrays = reader.load_raw_arrays(
+        sids=[asset.sid for asset in assets],
+        fields=[field],
+        start_dt=dt,
+        end_dt=dt
+    )
+    return arrays[0][0]
 
-            if np.isnan(close):
-                has_data = False
 
-        except Exception:
-            has_data = False
+def ranges_in_bundle(assets, start_dt, end_dt, reader):
+    """
+    Evaluate whether price data of each asset has been ingested in the
+    exchange bundle for the given date range.
+
+    The bundle is probed for all the ingested assets at once, the others
+    have no data. If the bulk read fails, we fall back to probing each
+    asset individually, in a thread pool since the bcolz reads release
+    the GIL.
+
+    Parameters
+    ----------
+    assets: list[TradingPair]
+    start_dt: datetime
+    end_dt: datetime
+    reader: BcolzBarMinuteReader
+
+    Returns
+    -------
+    np.ndarray[bool]
+
+    """
+    if reader is None:
+        return np.zeros(len(assets), dtype=bool)
+
+    # The dates out of the bounds of the bundle have no data, reading them
+    # would fail for all the assets
+    if start_dt < reader.first_trading_day or \
+            end_dt > reader.last_available_dt:
+        return np.zeros(len(assets), dtype=bool)
+
+    # The assets which were never ingested have no data in the bundle,
+    # they must not fail the read of the other assets
+    has_data = np.array(
+        [reader.has_sid(asset.sid) for asset in assets], dtype=bool
+    )
+    indices = np.flatnonzero(has_data)
+    if not len(indices):
+        return has_data
+
+    ingested = [assets[index] for index in indices]
+    try:
+        for dt in (start_dt, end_dt):
+            closes = get_values_in_bundle(ingested, 'close', dt, reader)
+            has_data[indices] &= ~np.isnan(closes)
+
+    except Exception:
+        probe = partial(
+            range_in_bundle,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            reader=reader
+        )
+        if len(ingested) == 1:
+            has_data[indices] = probe(ingested[0])
+
+        else:
+            pool = ThreadPool(min(PROBE_THREADS, len(ingested)))
+            try:
+                has_data[indices] = pool.map(probe, ingested)
+            finally:
+                pool.close()
+                pool.join()
 
     return has_data
 
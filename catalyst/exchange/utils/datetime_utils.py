@@ -3,8 +3,10 @@ import math
 import re
 from datetime import datetime, timedelta, date
 
+import numpy as np
 import pandas as pd
 import pytz
+from pandas.tseries.offsets import MonthEnd, YearEnd
 
 from catalyst.exchange.exchange_errors import InvalidHistoryFrequencyError, \
     InvalidHistoryFrequencyAlias
@@ -249,6 +251,58 @@ def get_year_start_end(dt, first_day=None, last_day=None):
     return year_start, year_end
 
 
+def get_periods_start_end(start_dt, end_dt, data_frequency):
+    """
+    The bundle periods (months for minute data, years for daily data)
+    covering the specified date range, with their first and last day.
+
+    The first and last periods are bound by the specified dates, the
+    other periods end no later than the current day.
+
+    Parameters
+    ----------
+    start_dt: pd.Timestamp
+    end_dt: pd.Timestamp
+    data_frequency: str
+
+    Returns
+    -------
+    list[str], DatetimeIndex, DatetimeIndex
+        The period labels, first days and last days.
+
+    """
+    if data_frequency == 'minute':
+        freq, label_format = 'MS', '%Y-%m'
+        period_end = MonthEnd(0)
+        day_end = pd.Timedelta(hours=23, minutes=59)
+    else:
+        freq, label_format = 'AS', '%Y'
+        period_end = YearEnd(0)
+        day_end = pd.Timedelta(0)
+
+    dates = pd.date_range(
+        start=get_period_label(start_dt, data_frequency),
+        end=get_period_label(end_dt, data_frequency),
+        freq=freq,
+        tz=pytz.UTC
+    )
+    labels = list(dates.strftime(label_format))
+
+    # The bounds are computed over the epoch values of the dates
+    starts = dates.asi8.copy()
+    starts[0] = pd.Timestamp(start_dt).value
+
+    today = pd.Timestamp.utcnow().floor('1D')
+    ends = np.minimum((dates + period_end + day_end).asi8, today.value)
+    ends[-1] = pd.Timestamp(end_dt).value
+
+    return (
+        labels,
+        pd.DatetimeIndex(starts, tz=pytz.UTC),
+        pd.DatetimeIndex(ends, tz=pytz.UTC)
+    )
+
+
 def get_frequency(freq, data_frequency=None, supported_freqs=['D', 'H', 'T']):
     """
     Takes an arbitrary candle size (e.g. 15T) and converts to the lowest
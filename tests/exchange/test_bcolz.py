@@ -2,13 +2,17 @@ import random
 import shutil
 import tempfile
 
+import numpy as np
 import pandas as pd
-from nose.tools import assert_equals
+from nose.tools import assert_equals, assert_true
 
+from catalyst.assets._assets import TradingPair
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarWriter, \
     BcolzExchangeBarReader
 from catalyst.exchange.exchange_bundle import ExchangeBundle
-from catalyst.exchange.utils.bundle_utils import get_df_from_arrays
+from catalyst.exchange.utils import bundle_utils
+from catalyst.exchange.utils.bundle_utils import get_df_from_arrays, \
+    ranges_in_bundle
 
 
 class TestBcolzWriter(object):
@@ -106,6 +110,165 @@ class TestBcolzWriter(object):
         writer.write(data)
         pass
 
+    def test_bcolz_read_daily_multiple_sids(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-12-31', utc=True)
+        late_start = pd.to_datetime('2016-07-01', utc=True)
+
+        reader = self.write_daily_sids(start, end, late_start)
+        arrays = reader.load_raw_arrays(['close'], start, end, [1, 2])
+
+        bundle = ExchangeBundle('bitfinex')
+        periods = bundle.get_calendar_periods_range(start, end, 'daily')
+        late_idx = periods.get_loc(late_start)
+
+        assert_true(not np.isnan(arrays[0][:, 0]).any())
+        assert_true(np.isnan(arrays[0][:late_idx, 1]).all())
+        assert_true(not np.isnan(arrays[0][late_idx:, 1]).any())
+
+    def write_daily_sids(self, start, end, late_start):
+        freq = 'daily'
+        writer = BcolzExchangeBarWriter(
+            rootdir=self.root_dir,
+            start_session=start,
+            end_session=end,
+            data_frequency=freq,
+            write_metadata=True)
+
+        data = []
+        data.append((1, self.generate_df('bitfinex', freq, start, end)))
+        data.append((2, self.generate_df('bitfinex', freq, late_start, end)))
+        writer.write(data)
+
+        return BcolzExchangeBarReader(rootdir=self.root_dir,
+                                      data_frequency=freq)
+
+    def get_range_assets(self):
+        # The third asset was never ingested
+        return [
+            TradingPair(symbol='eth_btc', exchange='bitfinex', sid=1),
+            TradingPair(symbol='neo_btc', exchange='bitfinex', sid=2),
+            TradingPair(symbol='xrp_btc', exchange='bitfinex', sid=3),
+        ]
+
+    def test_ranges_in_bundle(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-12-31', utc=True)
+        late_start = pd.to_datetime('2016-07-01', utc=True)
+
+        reader = self.write_daily_sids(start, end, late_start)
+        assets = self.get_range_assets()
+
+        has_data = ranges_in_bundle(assets, start, end, reader)
+        assert_equals(list(has_data), [True, False, False])
+
+        has_data = ranges_in_bundle(assets, late_start, end, reader)
+        assert_equals(list(has_data), [True, True, False])
+
+        before_start = start - pd.Timedelta(days=1)
+        has_data = ranges_in_bundle(assets, before_start, end, reader)
+        assert_equals(list(has_data), [False, False, False])
+
+        assert_equals(len(ranges_in_bundle([], start, end, reader)), 0)
+
+    def test_ranges_in_bundle_fallback(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-12-31', utc=True)
+        late_start = pd.to_datetime('2016-07-01', utc=True)
+
+        reader = self.write_daily_sids(start, end, late_start)
+        assets = self.get_range_assets()
+
+        # Failing the bulk read to probe the assets one by one
+        load_raw_arrays = reader.load_raw_arrays
+
+        def load_single_sid(fields, start_dt, end_dt, sids):
+            if len(sids) > 1:
+                raise ValueError('unable to read several sids')
+
+            return load_raw_arrays(fields, start_dt, end_dt, sids)
+
+        reader.load_raw_arrays = load_single_sid
+
+        has_data = ranges_in_bundle(assets, start, end, reader)
+        assert_equals(list(has_data), [True, False, False])
+
+        has_data = ranges_in_bundle(assets, late_start, end, reader)
+        assert_equals(list(has_data), [True, True, False])
+
+    def test_ranges_in_bundle_after_end(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-12-31', utc=True)
+        late_start = pd.to_datetime('2016-07-01', utc=True)
+
+        reader = self.write_daily_sids(start, end, late_start)
+        assets = self.get_range_assets()
+
+        # Failing the per-asset fallback to ensure it is not used
+        def no_thread_pool(processes):
+            raise AssertionError('the assets were probed one by one')
+
+        thread_pool = bundle_utils.ThreadPool
+        bundle_utils.ThreadPool = no_thread_pool
+        try:
+            after_end = end + pd.Timedelta(days=5)
+            has_data = ranges_in_bundle(assets, late_start, after_end, reader)
+            assert_equals(list(has_data), [False, False, False])
+
+            has_data = ranges_in_bundle(assets, late_start, end, reader)
+            assert_equals(list(has_data), [True, True, False])
+
+        finally:
+            bundle_utils.ThreadPool = thread_pool
+
+    def test_prepare_chunks(self):
+        start = pd.to_datetime('2016-01-01', utc=True)
+        end = pd.to_datetime('2016-12-31', utc=True)
+        late_start = pd.to_datetime('2016-07-01', utc=True)
+        freq = 'daily'
+
+        self.write_daily_sids(start, end, late_start)
+
+        # Reading the bundle written in the temporary directory
+        bundle = ExchangeBundle('bitfinex')
+        bundle._bundle_paths[freq] = self.root_dir
+
+        # The bundle has data for the first asset in 2016 only, from
+        # July for the second asset and none for the third asset
+        first, second, third = [
+            TradingPair(
+                symbol=symbol,
+                exchange='bitfinex',
+                sid=sid,
+                start_date=pd.to_datetime(start_date, utc=True),
+                end_daily=pd.to_datetime(end_daily, utc=True),
+            ) for symbol, sid, start_date, end_daily in [
+                ('eth_btc', 1, '2015-06-01', '2017-06-30'),
+                ('neo_btc', 2, '2016-03-01', '2017-03-31'),
+                ('xrp_btc', 3, '2016-01-01', '2016-12-31'),
+            ]
+        ]
+
+        chunks = bundle.prepare_chunks(
+            assets=[first, second, third],
+            data_frequency=freq,
+            start_dt=pd.to_datetime('2015-01-01', utc=True),
+            end_dt=pd.to_datetime('2017-12-31', utc=True),
+        )
+
+        expected = {
+            first: ['2015', '2017'],
+            second: ['2016', '2017'],
+            third: ['2016'],
+        }
+        assert_equals(set(chunks), set(expected))
+
+        for asset, periods in expected.items():
+            observed = [chunk['period'] for chunk in chunks[asset]]
+            assert_equals(observed, periods)
+            for chunk in chunks[asset]:
+                assert_equals(chunk['asset'], asset)
+
     def bcolz_exchange_daily_write_read(self, exchange_name):
         start = pd.to_datetime('2017-10-01 00:00')
         end = pd.to_datetime('today')
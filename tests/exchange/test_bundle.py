@@ -1,14 +1,21 @@
 # import hashlib
 import os
 import tempfile
+import time
 from logging import getLogger
 
+import numpy as np
 import pandas as pd
+from nose.tools import assert_equals, assert_raises, assert_true
 
+from catalyst.assets._assets import TradingPair
+from catalyst.exchange import exchange_bundle
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
     BcolzExchangeBarWriter
 from catalyst.exchange.exchange_bundle import ExchangeBundle, \
     BUNDLE_NAME_TEMPLATE
+from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
+    NoDataAvailableOnExchange
 from catalyst.exchange.utils.bundle_utils import get_bcolz_chunk, \
     get_df_from_arrays
 from catalyst.exchange.utils.datetime_utils import get_start_dt
@@ -20,6 +27,49 @@ from catalyst.utils.paths import ensure_directory
 log = getLogger('test_exchange_bundle')
 
 
+def get_adj_dates_by_asset(bundle, start, end, assets, data_frequency):
+    """
+    The date range of ExchangeBundle.get_adj_dates, comparing the dates of
+    the assets one by one.
+    """
+    earliest_trade = None
+    last_entry = None
+    for asset in assets:
+        if earliest_trade is None or earliest_trade > asset.start_date:
+            if asset.start_date >= bundle.calendar.first_session:
+                earliest_trade = asset.start_date
+
+            else:
+                earliest_trade = bundle.calendar.first_session
+
+        end_asset = asset.end_minute if data_frequency == 'minute' else \
+            asset.end_daily
+        if end_asset is not None:
+            if last_entry is None or end_asset > last_entry:
+                last_entry = end_asset
+
+        else:
+            end = None
+            last_entry = None
+
+    if start is None or \
+            (earliest_trade is not None and earliest_trade > start):
+        start = earliest_trade
+
+    if last_entry is not None and (end is None or end > last_entry):
+        end = last_entry.replace(minute=59, hour=23) \
+            if data_frequency == 'minute' else last_entry
+
+    if end is None or start is None or start > end:
+        raise NoDataAvailableOnExchange(
+            exchange=[asset.exchange for asset in assets],
+            symbol=[asset.symbol for asset in assets],
+            data_frequency=data_frequency,
+        )
+
+    return start, end
+
+
 class TestExchangeBundle:
     def test_spot_value(self):
         # data_frequency = 'daily'
@@ -548,3 +598,259 @@ class TestExchangeBundle:
             end_dt=end_dt
         )
         pass
+
+    def get_empty_rows_data(self, empty_indices, dropped_indices=None):
+        asset = TradingPair(
+            symbol='eth_btc',
+            exchange='bitfinex',
+            sid=1,
+            start_date=pd.Timestamp('2018-01-01 00:02', tz='UTC'),
+            end_daily=pd.Timestamp('2018-01-01', tz='UTC'),
+            end_minute=pd.Timestamp('2018-01-01 00:09', tz='UTC'),
+        )
+
+        dts = pd.date_range(
+            '2018-01-01 00:00', periods=10, freq='T', tz='UTC'
+        ).values
+        cols = dict(
+            (field, np.arange(1.0, 11.0))
+            for field in ['open', 'high', 'low', 'close', 'volume']
+        )
+        cols['close'][empty_indices] = np.nan
+
+        if dropped_indices is not None:
+            dts = np.delete(dts, dropped_indices)
+            cols = dict(
+                (field, np.delete(values, dropped_indices))
+                for field, values in cols.items()
+            )
+
+        return asset, dts, cols
+
+    def test_spot_empty_periods_none(self):
+        bundle = ExchangeBundle('bitfinex')
+        asset, dts, cols = self.get_empty_rows_data([])
+
+        problems, strip = bundle._spot_empty_periods(
+            dts, np.isnan(cols['close']), asset, 'minute', 'strip'
+        )
+        assert_equals(problems, [])
+        assert_true(not strip)
+
+        data, problems = bundle._prepare_cols(
+            asset, dts, cols, 'minute', 'strip'
+        )
+        assert_equals(len(data[0][1]), 10)
+
+    def test_spot_empty_periods_before_start(self):
+        bundle = ExchangeBundle('bitfinex')
+        asset, dts, cols = self.get_empty_rows_data([0, 1, 2])
+
+        problems, strip = bundle._spot_empty_periods(
+            dts, np.isnan(cols['close']), asset, 'minute', 'raise'
+        )
+        assert_equals(problems, [None])
+        assert_true(not strip)
+
+    def test_spot_empty_periods_ranges(self):
+        bundle = ExchangeBundle('bitfinex')
+        asset, dts, cols = self.get_empty_rows_data([3, 4, 7])
+        empty_rows = np.isnan(cols['close'])
+
+        problems, strip = bundle._spot_empty_periods(
+            dts, empty_rows, asset, 'minute', 'warn'
+        )
+        assert_equals(len(problems), 1)
+        assert_true(
+            "['2018-01-01 00:03 - 2018-01-01 00:04', "
+            "'2018-01-01 00:07 - 2018-01-01 00:07']" in problems[0]
+        )
+        assert_true(not strip)
+
+        with assert_raises(EmptyValuesInBundleError):
+            bundle._spot_empty_periods(
+                dts, empty_rows, asset, 'minute', 'raise'
+            )
+
+        # A row missing from the index breaks a range
+        asset, dts, cols = self.get_empty_rows_data([4, 6], [5])
+        problems, _ = bundle._spot_empty_periods(
+            dts, np.isnan(cols['close']), asset, 'minute', 'warn'
+        )
+        assert_true(
+            "['2018-01-01 00:04 - 2018-01-01 00:04', "
+            "'2018-01-01 00:06 - 2018-01-01 00:06']" in problems[0]
+        )
+
+    def test_prepare_cols_strip(self):
+        bundle = ExchangeBundle('bitfinex')
+        asset, dts, cols = self.get_empty_rows_data([3, 4, 7])
+
+        data, problems = bundle._prepare_cols(
+            asset, dts, cols, 'minute', 'strip'
+        )
+        assert_equals(len(problems), 1)
+        assert_equals(len(data), 1)
+
+        sid, data_dts, data_cols = data[0]
+        assert_equals(sid, 1)
+        assert_equals(len(data_dts), 7)
+        for values in data_cols.values():
+            assert_equals(len(values), 7)
+        assert_true(not np.isnan(data_cols['close']).any())
+
+    def verify_adj_dates(self, bundle, start, end, assets):
+        for data_frequency in ['minute', 'daily']:
+            try:
+                expected = get_adj_dates_by_asset(
+                    bundle, start, end, assets, data_frequency
+                )
+            except NoDataAvailableOnExchange:
+                with assert_raises(NoDataAvailableOnExchange):
+                    bundle.get_adj_dates(start, end, assets, data_frequency)
+                continue
+
+            observed = bundle.get_adj_dates(
+                start, end, assets, data_frequency
+            )
+            assert_equals(observed, expected)
+
+    def test_get_adj_dates(self):
+        bundle = ExchangeBundle('bitfinex')
+        first_session = bundle.calendar.first_session
+
+        def get_asset(symbol, sid, start_days, end_days):
+            end_daily = first_session + pd.Timedelta(days=end_days) \
+                if end_days is not None else None
+            end_minute = end_daily + pd.Timedelta(hours=5) \
+                if end_daily is not None else None
+
+            return TradingPair(
+                symbol=symbol,
+                exchange='bitfinex',
+                sid=sid,
+                start_date=first_session + pd.Timedelta(days=start_days),
+                end_daily=end_daily,
+                end_minute=end_minute,
+            )
+
+        # The first asset starts before the first session of the calendar
+        early = get_asset('eth_btc', 1, -10, 100)
+        late = get_asset('neo_btc', 2, 30, 200)
+        open_ended = get_asset('xrp_btc', 3, 60, None)
+
+        start = first_session + pd.Timedelta(days=20)
+        end = first_session + pd.Timedelta(days=150)
+        after_end = first_session + pd.Timedelta(days=400)
+
+        for assets in [[early], [late, early], [early, late]]:
+            self.verify_adj_dates(bundle, None, after_end, assets)
+            self.verify_adj_dates(bundle, start, end, assets)
+
+        # An asset without an end date in the middle and at the tail
+        for assets in [[early, open_ended, late], [early, late, open_ended]]:
+            self.verify_adj_dates(bundle, None, after_end, assets)
+            self.verify_adj_dates(bundle, start, end, assets)
+
+        # The range is after the end of the assets
+        self.verify_adj_dates(
+            bundle, after_end, after_end + pd.Timedelta(days=1), [early]
+        )
+
+    def get_ingest_bundle(self, periods, failing_period=None):
+        bundle = ExchangeBundle('bitfinex')
+        asset = TradingPair(symbol='eth_btc', exchange='bitfinex', sid=1)
+        started, finished, written = [], [], []
+
+        def prepare_chunks(assets, data_frequency, start_dt, end_dt):
+            return {
+                asset: [dict(asset=asset, period=period)
+                        for period in periods]
+            }
+
+        def fetch_ctable(asset, data_frequency, period,
+                         empty_rows_behavior='strip', cleanup=False):
+            started.append(period)
+            try:
+                # The first periods take longer to fetch than the next ones
+                time.sleep(0.01 * (len(periods) - periods.index(period)))
+
+                if period == failing_period:
+                    raise ValueError('unable to fetch {}'.format(period))
+
+                return [(asset.sid, period, dict())], []
+
+            finally:
+                finished.append(period)
+
+        def write(data, writer, data_frequency):
+            written.extend([dts for _, dts, _ in data])
+
+        bundle.prepare_chunks = prepare_chunks
+        bundle.get_writer = lambda start_dt, end_dt, data_frequency: None
+        bundle._fetch_ctable = fetch_ctable
+        bundle._write = write
+
+        return bundle, asset, started, finished, written
+
+    def get_ingest_periods(self):
+        # More periods than the fetches kept in flight
+        return list(pd.date_range(
+            '2016-01-01', periods=exchange_bundle.INGEST_QUEUE_SIZE + 4,
+            freq='MS'
+        ).strftime('%Y-%m'))
+
+    def test_ingest_assets_order(self):
+        periods = self.get_ingest_periods()
+        bundle, asset, started, finished, written = \
+            self.get_ingest_bundle(periods)
+
+        bundle.ingest_assets(
+            assets=[asset],
+            data_frequency='minute',
+            start_dt=pd.to_datetime('2016-01-01', utc=True),
+            end_dt=pd.to_datetime('2017-12-31', utc=True),
+        )
+        assert_equals(written, periods)
+        assert_equals(sorted(finished), periods)
+        assert_true(bundle._cleanup_pool is None)
+
+    def test_ingest_assets_error(self):
+        periods = self.get_ingest_periods()
+        bundle, asset, started, finished, written = \
+            self.get_ingest_bundle(periods, failing_period=periods[3])
+
+        with assert_raises(ValueError):
+            bundle.ingest_assets(
+                assets=[asset],
+                data_frequency='minute',
+                start_dt=pd.to_datetime('2016-01-01', utc=True),
+                end_dt=pd.to_datetime('2017-12-31', utc=True),
+            )
+
+        # The error is raised once the fetches in flight are done
+        assert_equals(written, periods[:3])
+        assert_equals(sorted(finished), sorted(started))
+        assert_true(bundle._cleanup_pool is None)
+
+    def test_ingest_assets_no_chunks(self):
+        bundle, asset, started, _, written = self.get_ingest_bundle([])
+
+        def no_thread_pool(processes):
+            raise AssertionError('a thread pool was created')
+
+        thread_pool = exchange_bundle.ThreadPool
+        exchange_bundle.ThreadPool = no_thread_pool
+        try:
+            bundle.ingest_assets(
+                assets=[asset],
+                data_frequency='minute',
+                start_dt=pd.to_datetime('2016-01-01', utc=True),
+                end_dt=pd.to_datetime('2017-12-31', utc=True),
+            )
+
+        finally:
+            exchange_bundle.ThreadPool = thread_pool
+
+        assert_equals(started, [])
+        assert_equals(written, [])
@@ -1,5 +1,6 @@
 from catalyst.exchange.utils.exchange_utils import transform_candles_to_df, \
     forward_fill_df_if_needed, get_candles_df
+from catalyst.exchange.utils.datetime_utils import get_periods_start_end
 
 from catalyst.testing.fixtures import WithLogger, CatalystTestCase
 from datetime import timedelta
@@ -173,3 +174,77 @@ class TestExchangeUtils(WithLogger, CatalystTestCase):
         self.verify_forward_fill_df_if_needed(candles, periods, expected_df)
         # Not the same due to dropna - commenting out for now
         # self.verify_get_candles_df(assets, candles, periods[2], expected_df)
+
+    def verify_periods_start_end(self, start_dt, end_dt, data_frequency,
+                                 expected_labels, expected_starts,
+                                 expected_ends):
+        labels, starts, ends = get_periods_start_end(
+            start_dt, end_dt, data_frequency
+        )
+        assert (labels == expected_labels)
+        assert (list(starts) == [Timestamp(dt, tz='UTC')
+                                 for dt in expected_starts])
+        assert (list(ends) == [Timestamp(dt, tz='UTC')
+                               for dt in expected_ends])
+
+    def test_get_periods_start_end_minute(self):
+        # single period
+        self.verify_periods_start_end(
+            Timestamp('2017-03-05 10:00', tz='UTC'),
+            Timestamp('2017-03-20 00:00', tz='UTC'),
+            'minute',
+            ['2017-03'],
+            ['2017-03-05 10:00'],
+            ['2017-03-20 00:00'],
+        )
+
+        # several periods across years
+        self.verify_periods_start_end(
+            Timestamp('2017-11-15', tz='UTC'),
+            Timestamp('2018-02-10', tz='UTC'),
+            'minute',
+            ['2017-11', '2017-12', '2018-01', '2018-02'],
+            ['2017-11-15', '2017-12-01', '2018-01-01', '2018-02-01'],
+            ['2017-11-30 23:59', '2017-12-31 23:59', '2018-01-31 23:59',
+             '2018-02-10'],
+        )
+
+    def test_get_periods_start_end_daily(self):
+        # single period
+        self.verify_periods_start_end(
+            Timestamp('2016-02-01', tz='UTC'),
+            Timestamp('2016-05-01', tz='UTC'),
+            'daily',
+            ['2016'],
+            ['2016-02-01'],
+            ['2016-05-01'],
+        )
+
+        # several years
+        self.verify_periods_start_end(
+            Timestamp('2015-06-01', tz='UTC'),
+            Timestamp('2017-03-01', tz='UTC'),
+            'daily',
+            ['2015', '2016', '2017'],
+            ['2015-06-01', '2016-01-01', '2017-01-01'],
+            ['2015-12-31', '2016-12-31', '2017-03-01'],
+        )
+
+    def test_get_periods_start_end_after_today(self):
+        today = Timestamp.utcnow().floor('1D')
+
+        for data_frequency, delta in [('minute', timedelta(days=70)),
+                                      ('daily', timedelta(days=800))]:
+            start_dt = today - delta
+            end_dt = today + delta
+
+            labels, starts, ends = get_periods_start_end(
+                start_dt, end_dt, data_frequency
+            )
+            assert (len(labels) == len(starts) == len(ends))
+            assert (starts[0] == start_dt)
+            assert (ends[-1] == end_dt)
+
+            # The periods other than the last one end no later than today
+            assert ((ends[:-1] <= today).all())
+            assert (ends[-2] == today)